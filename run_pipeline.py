@@ -11,18 +11,35 @@ This script runs the complete pipeline for processing PDF documents:
 
 import os
 import argparse
+import copy
 import logging
 import json
 import time
-import glob
+import hashlib
+import threading
+import inspect
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import (
+    ProcessPoolExecutor, ThreadPoolExecutor, as_completed)
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
-from src.pdf_processing.pipeline import process_pdf
-from src.pdf_processing.batch import process_pdf_batch
-from src.nlp.entity_extractor import process_document as extract_entities
-from src.utils.data_processor import process_extracted_data
-from src.database.db_operations import store_processed_data
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from blake3 import blake3 as _file_hasher
+    _FILE_HASH_NAME = "blake3"
+except ImportError:
+    _file_hasher = hashlib.sha256
+    _FILE_HASH_NAME = "sha256"
+
+# The src pipeline stages pull in spaCy, pdfplumber and SQLAlchemy, so they
+# are imported inside the functions that use them to keep startup fast
 
 # Setup logging
 logging.basicConfig(
@@ -35,13 +52,326 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Stage results are cached on disk by content hash so reruns and duplicate
+# documents skip NLP and normalization; recent hits are also kept in memory.
+# Bump CACHE_VERSION whenever cached results change shape or meaning.
+CACHE_VERSION = 1
+CACHE_DIRNAME = ".cache"
+_MEMORY_CACHE_SIZE = 1024
+_memory_cache: "OrderedDict[str, Any]" = OrderedDict()
+
+# Batch results from process_directory are written to this file in output_dir
+RESULTS_FILENAME = "results.ndjson"
+
+# Source hash and status of every PDF processed into output_dir, used by
+# --resume to skip documents that are already done
+MANIFEST_FILENAME = "manifest.json"
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# spaCy pipeline shared by every PDF a worker process handles
+_WORKER_NLP = None
+
+# Manifest entries from the previous run, when resuming
+_WORKER_MANIFEST: Dict[str, Dict[str, str]] = {}
+
+
+@lru_cache(maxsize=1)
+def _load_nlp(model_path: Optional[str] = None):
+    """Load the spaCy NER model, reusing it across calls with the same path."""
+    import spacy
+    return spacy.load(model_path or "en_core_web_sm")
+
+
+@lru_cache(maxsize=None)
+def _accepts_nlp(extractor) -> bool:
+    """Check whether an entity extractor accepts a preloaded nlp pipeline."""
+    try:
+        return 'nlp' in inspect.signature(extractor).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _init_worker(
+    model_path: Optional[str] = None,
+    manifest: Optional[Dict[str, Dict[str, str]]] = None
+) -> None:
+    """
+    Load the NER model and resume manifest once per worker process.
+
+    A model that fails to load is only logged here. An exception from a
+    pool initializer breaks the whole pool, so each PDF reports its own
+    failure when it tries to load the model instead.
+    """
+    global _WORKER_NLP, _WORKER_MANIFEST
+    _WORKER_MANIFEST = manifest or {}
+    _WORKER_NLP = None
+
+    try:
+        from src.nlp.entity_extractor import (
+            process_document as extract_entities)
+        if _accepts_nlp(extract_entities):
+            _WORKER_NLP = _load_nlp(model_path)
+    except Exception as e:
+        logger.error("Failed to load NER model in worker: %s", e)
+
+
+@contextmanager
+def _timed(label: str, timings: Dict[str, float]):
+    """Record the duration of the enclosed block in timings[label]."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[label] = time.perf_counter() - start
+
+
+def _dumps(data: Any, indent: bool = True) -> bytes:
+    """Serialize data to UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    return json.dumps(
+        data, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write data as indented UTF-8 JSON."""
+    path.write_bytes(_dumps(data))
+
+
+def _loads(payload: bytes) -> Any:
+    """Parse UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def _read_json(path: Path) -> Any:
+    """Read a JSON file."""
+    return _loads(path.read_bytes())
+
+
+def _file_digest(path: Path) -> str:
+    """Hash a file's contents in 1 MiB chunks, prefixed with the algorithm."""
+    hasher = _file_hasher()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return f"{_FILE_HASH_NAME}:{hasher.hexdigest()}"
+
+
+def _load_manifest(path: Path) -> Dict[str, Dict[str, str]]:
+    """Load a resume manifest, returning an empty one if missing or invalid."""
+    try:
+        return _read_json(path)
+    except (OSError, ValueError):
+        return {}
+
+
+def _result_sources(path: Path) -> set:
+    """Collect the source paths that have a row in a results.ndjson file."""
+    sources = set()
+    try:
+        with open(path, 'rb') as f:
+            for line in f:
+                try:
+                    row = _loads(line)
+                except ValueError:
+                    continue
+                if isinstance(row, dict) and 'source' in row:
+                    sources.add(row['source'])
+    except OSError:
+        pass
+    return sources
+
+
+def _file_size(path: Path) -> int:
+    """Return a file's size, or 0 if it cannot be read."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _is_done(
+    pdf_file: Path,
+    digest: str,
+    out: Path,
+    store_in_db: bool
+) -> bool:
+    """Check whether a PDF with this content was already fully processed."""
+    entry = _WORKER_MANIFEST.get(str(pdf_file.resolve()))
+    if not entry or entry.get('hash') != digest or entry.get('status') != 'ok':
+        return False
+    if not store_in_db:
+        return True
+
+    try:
+        db_result = _read_json(out / f"{pdf_file.stem}_db_result.json")
+    except (OSError, ValueError):
+        return False
+    return bool(db_result.get('success', False))
+
+
+class ResultSink:
+    """
+    NDJSON file collecting one processed result per PDF.
+
+    Used by process_directory instead of writing a separate
+    _processed.json file for every document. The file is truncated when
+    opened unless append is set, as it is when resuming a previous run.
+    """
+
+    def __init__(self, path: Path, append: bool = False):
+        self.path = path
+        self._file = open(path, 'ab' if append else 'wb')
+
+    def write(self, row: Dict[str, Any]) -> None:
+        """Append a single result as one JSON line."""
+        self._file.write(_dumps(row, indent=False) + b"\n")
+
+    def close(self) -> None:
+        """Flush and close the underlying file."""
+        self._file.close()
+
+    def __enter__(self) -> "ResultSink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+@lru_cache(maxsize=None)
+def _get_cache(cache_dir: str):
+    """Open an on-disk stage cache for the current process."""
+    from diskcache import Cache
+    return Cache(cache_dir)
+
+
+@lru_cache(maxsize=None)
+def _code_identity(func) -> str:
+    """Identify a stage's code by its module and source file mtime."""
+    try:
+        mtime = os.stat(inspect.getsourcefile(func)).st_mtime_ns
+    except (OSError, TypeError):
+        mtime = 0
+    return f"{func.__module__}.{func.__qualname__}:{mtime}"
+
+
+@lru_cache(maxsize=None)
+def _model_identity(model_path: Optional[str] = None) -> str:
+    """Identify an NER model by its on-disk meta or installed version."""
+    name = model_path or "en_core_web_sm"
+    model_dir = Path(name)
+    if model_dir.exists():
+        meta_path = model_dir / "meta.json"
+        stat_path = meta_path if meta_path.exists() else model_dir
+        return f"{model_dir.resolve()}:{stat_path.stat().st_mtime_ns}"
+
+    from importlib import metadata
+    try:
+        return f"{name}=={metadata.version(name)}"
+    except metadata.PackageNotFoundError:
+        return name
+
+
+def _content_key(stage: str, *parts: Any) -> str:
+    """Build a cache key from a stage name and its JSON-serializable inputs."""
+    if orjson is not None:
+        payload = orjson.dumps(
+            [stage, *parts],
+            default=str,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
+    else:
+        payload = json.dumps(
+            [stage, *parts], sort_keys=True, default=str).encode('utf-8')
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _cached(key: str, compute, cache_dir: str):
+    """
+    Return the cached result for key, computing and storing it on a miss.
+
+    Callers may modify the result in place, so the in-memory layer keeps
+    its own copy and hands out a fresh copy on every hit.
+    """
+    if key in _memory_cache:
+        _memory_cache.move_to_end(key)
+        return copy.deepcopy(_memory_cache[key])
+
+    cache = _get_cache(str(cache_dir))
+    result = cache.get(key)
+    if result is None:
+        result = compute()
+        cache.set(key, result)
+
+    _memory_cache[key] = copy.deepcopy(result)
+    if len(_memory_cache) > _MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+    return result
+
+
+def _cached_extract(
+    pdf_info: Dict[str, Any],
+    model_path: Optional[str] = None,
+    nlp=None,
+    cache_dir: Optional[str] = None
+) -> Dict[str, Any]:
+    """Extract entities, reusing earlier results for identical PDF content."""
+    from src.nlp.entity_extractor import process_document as extract_entities
+
+    def compute():
+        # Older extractors load the model themselves and take no nlp argument
+        if not _accepts_nlp(extract_entities):
+            return extract_entities(pdf_info, model_path)
+        model = nlp if nlp is not None else _load_nlp(model_path)
+        return extract_entities(pdf_info, model_path, nlp=model)
+
+    if cache_dir is None:
+        return compute()
+
+    key = _content_key(
+        "entities",
+        CACHE_VERSION,
+        _code_identity(extract_entities),
+        _model_identity(model_path),
+        pdf_info
+    )
+    return _cached(key, compute, cache_dir)
+
+
+def _cached_process(
+    entities_data: Dict[str, Any],
+    cache_dir: Optional[str] = None
+) -> Dict[str, Any]:
+    """Normalize extracted entities, reusing results for identical input."""
+    from src.utils.data_processor import process_extracted_data
+
+    def compute():
+        return process_extracted_data(entities_data)
+
+    if cache_dir is None:
+        return compute()
+
+    key = _content_key(
+        "processed",
+        CACHE_VERSION,
+        _code_identity(process_extracted_data),
+        entities_data
+    )
+    return _cached(key, compute, cache_dir)
+
 
 def process_single_pdf(
     pdf_path: str,
     output_dir: str,
     model_path: Optional[str] = None,
     save_intermediates: bool = False,
-    store_in_db: bool = True
+    store_in_db: bool = True,
+    cache_dir: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Process a single PDF file through the entire pipeline.
@@ -52,76 +382,96 @@ def process_single_pdf(
         model_path: Path to custom NER model (optional)
         save_intermediates: Whether to save intermediate results (default: False)
         store_in_db: Whether to store results in database (default: True)
+        cache_dir: Directory for cached stage results (default: None, disabled)
 
     Returns:
         Processing results
     """
+    from src.pdf_processing.pipeline import process_pdf
+    from src.database.db_operations import store_processed_data
+
     # Create output directory if it doesn't exist
-    os.makedirs(output_dir, exist_ok=True)
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
 
     # Get base filename without extension
-    filename = os.path.basename(pdf_path)
-    base_name = os.path.splitext(filename)[0]
-
-    logger.info(f"Processing {filename}")
-
-    # Step 1: Extract text from PDF
-    start_time = time.time()
-    pdf_info = process_pdf(pdf_path)
-    pdf_time = time.time() - start_time
-    logger.info(f"PDF extraction completed in {pdf_time:.2f} seconds")
-
-    # Save intermediate results if requested
-    if save_intermediates:
-        pdf_text_path = os.path.join(output_dir, f"{base_name}_text.json")
-        with open(pdf_text_path, 'w', encoding='utf-8') as f:
-            json.dump(pdf_info, f, indent=2, ensure_ascii=False)
-        logger.info(f"Extracted text saved to {pdf_text_path}")
-
-    # Step 2: Extract entities
-    start_time = time.time()
-    entities_data = extract_entities(pdf_info, model_path)
-    entity_time = time.time() - start_time
-    logger.info(f"Entity extraction completed in {entity_time:.2f} seconds")
-
-    # Save intermediate results if requested
-    if save_intermediates:
-        entities_path = os.path.join(output_dir, f"{base_name}_entities.json")
-        with open(entities_path, 'w', encoding='utf-8') as f:
-            json.dump(entities_data, f, indent=2, ensure_ascii=False)
-        logger.info(f"Extracted entities saved to {entities_path}")
-
-    # Step 3: Process extracted data
-    start_time = time.time()
-    processed_data = process_extracted_data(entities_data)
-    processing_time = time.time() - start_time
-    logger.info(f"Data processing completed in {processing_time:.2f} seconds")
-
-    # Save processed results
-    processed_path = os.path.join(output_dir, f"{base_name}_processed.json")
-    with open(processed_path, 'w', encoding='utf-8') as f:
-        json.dump(processed_data, f, indent=2, ensure_ascii=False)
-    logger.info(f"Processed data saved to {processed_path}")
-
-    # Step 4: Store in database if requested
-    db_result = {}
-    if store_in_db:
-        start_time = time.time()
-        db_result = store_processed_data(processed_data)
-        db_time = time.time() - start_time
+    pdf_file = Path(pdf_path)
+    filename = pdf_file.name
+    base_name = pdf_file.stem
+
+    logger.info("Processing %s", filename)
+
+    timings: Dict[str, float] = {}
+
+    # Result files are written on background threads so each stage can start
+    # without waiting for the previous stage's output to reach disk. Data is
+    # serialized here first, as later stages may modify the same objects.
+    writes = []
+    with ThreadPoolExecutor(max_workers=4) as writer:
+        # Step 1: Extract text from PDF
+        with _timed('pdf', timings):
+            pdf_info = process_pdf(pdf_path)
+        logger.info(
+            "PDF extraction completed in %.2f seconds", timings['pdf'])
+
+        # Save intermediate results if requested
+        if save_intermediates:
+            pdf_text_path = out / f"{base_name}_text.json"
+            writes.append(
+                writer.submit(pdf_text_path.write_bytes, _dumps(pdf_info)))
+            logger.info("Saving extracted text to %s", pdf_text_path)
+
+        # Step 2: Extract entities
+        with _timed('entities', timings):
+            entities_data = _cached_extract(
+                pdf_info, model_path, cache_dir=cache_dir)
+        logger.info("Entity extraction completed in %.2f seconds",
+                    timings['entities'])
+
+        # Save intermediate results if requested
+        if save_intermediates:
+            entities_path = out / f"{base_name}_entities.json"
+            writes.append(
+                writer.submit(
+                    entities_path.write_bytes, _dumps(entities_data)))
+            logger.info("Saving extracted entities to %s", entities_path)
+
+        # Step 3: Process extracted data
+        with _timed('processing', timings):
+            processed_data = _cached_process(entities_data, cache_dir)
+        logger.info("Data processing completed in %.2f seconds",
+                    timings['processing'])
+
+        # Save processed results
+        processed_path = out / f"{base_name}_processed.json"
+        writes.append(
+            writer.submit(processed_path.write_bytes, _dumps(processed_data)))
+        logger.info("Saving processed data to %s", processed_path)
+
+        # Step 4: Store in database if requested
+        db_result = {}
+        if store_in_db:
+            with _timed('database', timings):
+                db_result = store_processed_data(processed_data)
 
-        # Save database result
-        db_path = os.path.join(output_dir, f"{base_name}_db_result.json")
-        with open(db_path, 'w', encoding='utf-8') as f:
-            json.dump(db_result, f, indent=2)
-
-        if db_result.get('success', False):
-            logger.info(f"Data stored in database in {db_time:.2f} seconds")
-            logger.info(f"Document ID: {db_result.get('document_id')}")
-            logger.info(f"Product IDs: {db_result.get('product_ids', [])}")
-        else:
-            logger.error(
-                f"Failed to store data in database: {db_result.get('errors', [])}")
+            # Save database result
+            db_path = out / f"{base_name}_db_result.json"
+            writes.append(
+                writer.submit(db_path.write_bytes, _dumps(db_result)))
+
+            if db_result.get('success', False):
+                logger.info("Data stored in database in %.2f seconds",
+                            timings['database'])
+                logger.info("Document ID: %s", db_result.get('document_id'))
+                logger.info("Product IDs: %s",
+                            db_result.get('product_ids', []))
+            else:
+                logger.error("Failed to store data in database: %s",
+                             db_result.get('errors', []))
+
+    # Surface any errors raised while writing result files
+    for write in writes:
+        write.result()
 
     # Return combined results
     return {
@@ -129,21 +479,142 @@ def process_single_pdf(
             'filename': filename,
             'page_count': pdf_info.get('page_count', 0),
             'requires_ocr': pdf_info.get('requires_ocr', False),
-            'processing_time': pdf_time
+            'processing_time': timings['pdf']
         },
         'entity_extraction': {
             'entity_types': list(entities_data.get('entities', {}).keys()),
             'entity_count': sum(len(entities) for entities in entities_data.get('entities', {}).values()),
-            'processing_time': entity_time
+            'processing_time': timings['entities']
         },
         'data_processing': {
             'product_count': len(processed_data.get('products', [])),
-            'processing_time': processing_time
+            'processing_time': timings['processing']
         },
         'database_storage': db_result if store_in_db else {'skipped': True}
     }
 
 
+def _process_one(
+    pdf_file: Path,
+    out: Path,
+    model_path: Optional[str] = None,
+    save_intermediates: bool = False,
+    store_in_db: bool = True,
+    resume: bool = False,
+    cache_dir: Optional[str] = None
+) -> Tuple[str, Optional[str], bool, Optional[Dict[str, Any]]]:
+    """
+    Run a single PDF through extraction, NLP and normalization.
+
+    Executed inside a worker process by process_directory, so the extracted
+    text stays in memory instead of round-tripping through disk. The
+    processed data is returned for the parent to append to its ResultSink
+    and store in the database.
+
+    Args:
+        pdf_file: Path to the PDF file
+        out: Directory to save results
+        model_path: Path to custom NER model (optional)
+        save_intermediates: Whether to save intermediate results
+        store_in_db: Whether results are being stored in database
+        resume: Whether to skip PDFs already recorded as done
+        cache_dir: Directory for cached stage results (optional)
+
+    Returns:
+        Tuple of (absolute source path, content hash, skipped flag,
+        processed data or None on error or skip)
+    """
+    from src.pdf_processing.pipeline import process_pdf
+
+    # Key results by absolute path so that resumed runs match however
+    # the input directory was spelled
+    source = str(pdf_file.resolve())
+    base_name = pdf_file.stem
+    digest = None
+
+    try:
+        # Hash on every run, not only with --resume, so that the manifest
+        # this run writes lets a later resumed run skip the PDF
+        digest = _file_digest(pdf_file)
+
+        # Skip unchanged PDFs that completed on a previous run
+        if resume and _is_done(pdf_file, digest, out, store_in_db):
+            return source, digest, True, None
+
+        # Extract text from PDF
+        pdf_info = process_pdf(str(pdf_file))
+
+        # Save extracted text if requested
+        if save_intermediates:
+            pdf_text_path = out / f"{base_name}_text.json"
+            _write_json(pdf_text_path, pdf_info)
+
+        # Extract entities
+        entities_data = _cached_extract(
+            pdf_info, model_path, _WORKER_NLP, cache_dir)
+
+        # Save entities if requested
+        if save_intermediates:
+            entities_path = out / f"{base_name}_entities.json"
+            _write_json(entities_path, entities_data)
+
+        # Process extracted data
+        processed_data = _cached_process(entities_data, cache_dir)
+
+        # Save processed data if requested
+        if save_intermediates:
+            processed_path = out / f"{base_name}_processed.json"
+            _write_json(processed_path, processed_data)
+
+        return source, digest, False, processed_data
+
+    except Exception as e:
+        logger.error("Error processing %s: %s", pdf_file, e)
+        return source, digest, False, None
+
+
+def _store_result(
+    filename: str,
+    processed_data: Dict[str, Any],
+    out: Path
+) -> bool:
+    """
+    Store one document's processed data and save the database result.
+
+    Runs on process_directory's database writer thread.
+
+    Args:
+        filename: Source PDF filename
+        processed_data: Processed data to store
+        out: Directory to save results
+
+    Returns:
+        Whether the data was stored successfully
+    """
+    from src.database.db_operations import store_processed_data
+
+    base_name = Path(filename).stem
+
+    try:
+        db_result = store_processed_data(processed_data)
+
+        # Save database result
+        db_path = out / f"{base_name}_db_result.json"
+        _write_json(db_path, db_result)
+
+        if not db_result.get('success', False):
+            logger.error("Failed to store data for %s in database: %s",
+                         filename, db_result.get('errors', []))
+            return False
+
+        logger.debug("Data for %s stored in database", filename)
+        return True
+
+    except Exception as e:
+        logger.error("Error storing data for %s: %s", filename, e)
+        return False
+
+
 def process_directory(
     input_dir: str,
     output_dir: str,
@@ -151,11 +622,22 @@ def process_directory(
     file_pattern: str = "*.pdf",
     save_intermediates: bool = False,
     store_in_db: bool = True,
-    max_workers: int = 4
+    max_workers: int = 4,
+    resume: bool = False,
+    cache_dir: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Process all PDF files in a directory.
 
+    Processed results are written to a single results.ndjson file in
+    output_dir, one row per PDF keyed by its source path. The file is
+    replaced on each run; a resumed run appends to it, and a row for a
+    retried source supersedes earlier rows for the same source. Per-file
+    _processed.json files are only written when save_intermediates is set.
+
+    The outcome for each PDF is recorded in manifest.json so that a
+    resumed run can skip unchanged, completed files.
+
     Args:
         input_dir: Directory containing PDF files
         output_dir: Directory to save results
@@ -164,109 +646,159 @@ def process_directory(
         save_intermediates: Whether to save intermediate results (default: False)
         store_in_db: Whether to store results in database (default: True)
         max_workers: Maximum number of parallel workers (default: 4)
+        resume: Whether to skip PDFs completed by a previous run (default: False)
+        cache_dir: Directory for cached stage results (default: None, disabled)
 
     Returns:
         Processing results summary
     """
-    logger.info(f"Processing directory: {input_dir}")
-    logger.info(f"File pattern: {file_pattern}")
+    logger.info("Processing directory: %s", input_dir)
+    logger.info("File pattern: %s", file_pattern)
 
     # Create output directory if it doesn't exist
-    os.makedirs(output_dir, exist_ok=True)
-
-    # Find PDF files
-    pdf_files = list(glob.glob(os.path.join(input_dir, file_pattern)))
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+
+    # Find PDF files, largest first so that big documents start early and
+    # small ones fill in behind them instead of one straggler finishing last
+    pdf_files = sorted(
+        Path(input_dir).glob(file_pattern),
+        key=_file_size,
+        reverse=True
+    )
 
     if not pdf_files:
-        logger.warning(
-            f"No PDF files found in {input_dir} matching pattern {file_pattern}")
+        logger.warning("No PDF files found in %s matching pattern %s",
+                       input_dir, file_pattern)
         return {'error': 'No PDF files found', 'file_count': 0}
 
-    logger.info(f"Found {len(pdf_files)} PDF files")
-
-    # Process batch in parallel
-    batch_results = process_pdf_batch(
-        input_dir=input_dir,
-        output_dir=output_dir,
-        max_workers=max_workers,
-        file_pattern=file_pattern.lstrip("*"),
-        save_results=True
+    logger.info("Found %s PDF files", len(pdf_files))
+
+    # Run every PDF through the pipeline in parallel
+    worker = partial(
+        _process_one,
+        out=out,
+        model_path=model_path,
+        save_intermediates=save_intermediates,
+        store_in_db=store_in_db,
+        resume=resume,
+        cache_dir=cache_dir
     )
 
-    # Process and store the extracted data
+    manifest_path = out / MANIFEST_FILENAME
+    results_path = out / RESULTS_FILENAME
+
+    # The manifest must describe the same runs as results.ndjson: a fresh run
+    # starts both empty, and a resumed run only trusts entries whose rows
+    # are still in the results file it appends to
+    manifest = {}
+    if resume:
+        result_sources = _result_sources(results_path)
+        manifest = {
+            source: entry
+            for source, entry in _load_manifest(manifest_path).items()
+            if source in result_sources
+        }
+    manifest_lock = threading.Lock()
+
+    def record(source: str, digest: str, status: str) -> None:
+        with manifest_lock:
+            manifest[source] = {'hash': digest, 'status': status}
+
+    def record_store(source: str, digest: str, future) -> None:
+        # Runs on the database writer thread as soon as each store finishes,
+        # so stored documents are in the manifest even if the run stops early
+        if not future.cancelled():
+            record(source, digest, 'ok' if future.result() else 'failed')
+
     successful = 0
     failed = 0
+    skipped = 0
     products_found = 0
+    pending_stores = []
+
+    # Database writes run on a single dedicated thread in this process, so
+    # they overlap with the workers' CPU-bound stages and share one
+    # connection pool instead of one per worker
+    try:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(model_path, manifest if resume else None)
+        ) as executor, ThreadPoolExecutor(max_workers=1) as db_writer, \
+                ResultSink(results_path, append=resume) as sink:
+            # Submit largest-first; one failed future, or a worker that dies
+            # and breaks the pool, only fails the files it affects
+            futures = {
+                executor.submit(worker, pdf_file): pdf_file
+                for pdf_file in pdf_files
+            }
+            for future in as_completed(futures):
+                try:
+                    source, digest, was_skipped, processed_data = \
+                        future.result()
+                except Exception as e:
+                    logger.error("Error processing %s: %s", futures[future], e)
+                    failed += 1
+                    continue
 
-    for pdf_file in pdf_files:
-        try:
-            # Get base filename without extension
-            filename = os.path.basename(pdf_file)
-            base_name = os.path.splitext(filename)[0]
-
-            # Path to extracted JSON file
-            json_path = os.path.join(output_dir, f"{base_name}.json")
-
-            if not os.path.exists(json_path):
-                logger.warning(f"Extraction result not found for {filename}")
-                failed += 1
-                continue
-
-            # Load extracted data
-            with open(json_path, 'r', encoding='utf-8') as f:
-                pdf_info = json.load(f)
-
-            # Extract entities
-            entities_data = extract_entities(pdf_info, model_path)
-
-            # Save entities if requested
-            if save_intermediates:
-                entities_path = os.path.join(
-                    output_dir, f"{base_name}_entities.json")
-                with open(entities_path, 'w', encoding='utf-8') as f:
-                    json.dump(entities_data, f, indent=2, ensure_ascii=False)
-
-            # Process extracted data
-            processed_data = process_extracted_data(entities_data)
-
-            # Save processed data
-            processed_path = os.path.join(
-                output_dir, f"{base_name}_processed.json")
-            with open(processed_path, 'w', encoding='utf-8') as f:
-                json.dump(processed_data, f, indent=2, ensure_ascii=False)
-
-            # Store in database if requested
-            if store_in_db:
-                db_result = store_processed_data(processed_data)
+                if was_skipped:
+                    skipped += 1
+                    continue
 
-                # Save database result
-                db_path = os.path.join(
-                    output_dir, f"{base_name}_db_result.json")
-                with open(db_path, 'w', encoding='utf-8') as f:
-                    json.dump(db_result, f, indent=2)
+                if processed_data is None:
+                    failed += 1
+                    if digest is not None:
+                        record(source, digest, 'failed')
+                    continue
+
+                filename = Path(source).name
+                try:
+                    sink.write({
+                        'source': source,
+                        'filename': filename,
+                        'processed_data': processed_data
+                    })
+                except Exception as e:
+                    logger.error("Error writing results for %s: %s",
+                                 filename, e)
+                    failed += 1
+                    record(source, digest, 'failed')
+                    continue
+
+                products_count = len(processed_data.get('products', []))
 
-                if db_result.get('success', False):
-                    logger.info(f"Data for {filename} stored in database")
-                    products_found += len(processed_data.get('products', []))
+                if store_in_db:
+                    future = db_writer.submit(
+                        _store_result, filename, processed_data, out)
+                    future.add_done_callback(
+                        partial(record_store, source, digest))
+                    pending_stores.append((future, products_count))
+                else:
                     successful += 1
+                    products_found += products_count
+                    record(source, digest, 'ok')
+
+            for future, products_count in pending_stores:
+                if future.result():
+                    successful += 1
+                    products_found += products_count
                 else:
-                    logger.error(
-                        f"Failed to store data for {filename} in database: {db_result.get('errors', [])}")
                     failed += 1
-            else:
-                products_found += len(processed_data.get('products', []))
-                successful += 1
-
-        except Exception as e:
-            logger.error(f"Error processing {pdf_file}: {e}")
-            failed += 1
+    finally:
+        # Record progress even if the run is interrupted; leaving the
+        # executors above waits for in-flight stores and their callbacks
+        with manifest_lock:
+            _write_json(manifest_path, manifest)
 
     # Return summary
     return {
         'file_count': len(pdf_files),
         'successful': successful,
         'failed': failed,
-        'products_found': products_found
+        'skipped': skipped,
+        'products_found': products_found,
+        'results_path': str(results_path)
     }
 
 
@@ -286,46 +818,59 @@ def main():
                         action="store_true", help="Save intermediate results")
     parser.add_argument("--no-db", action="store_true",
                         help="Skip database storage")
+    parser.add_argument("--cache-dir",
+                        help="Directory for cached NLP and normalization "
+                             "results (default: <output-dir>/.cache)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Disable the NLP and normalization cache")
 
     # Batch processing options
     parser.add_argument("--pattern", default="*.pdf",
                         help="File pattern for batch processing (default: *.pdf)")
     parser.add_argument("--workers", type=int, default=4,
                         help="Maximum number of parallel workers (default: 4)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Skip PDFs completed by a previous run")
 
     args = parser.parse_args()
 
+    cache_dir = None
+    if not args.no_cache:
+        cache_dir = args.cache_dir or os.path.join(
+            args.output_dir, CACHE_DIRNAME)
+
     # Determine if input is a file or directory
     if os.path.isfile(args.input):
         # Process single file
-        logger.info(f"Processing single file: {args.input}")
+        logger.info("Processing single file: %s", args.input)
         result = process_single_pdf(
             pdf_path=args.input,
             output_dir=args.output_dir,
             model_path=args.model,
             save_intermediates=args.save_intermediates,
-            store_in_db=not args.no_db
+            store_in_db=not args.no_db,
+            cache_dir=cache_dir
         )
 
         # Print summary
         logger.info("Processing completed")
-        logger.info(f"PDF: {result['pdf_info']['filename']}")
-        logger.info(f"Pages: {result['pdf_info']['page_count']}")
-        logger.info(f"OCR required: {result['pdf_info']['requires_ocr']}")
+        logger.info("PDF: %s", result['pdf_info']['filename'])
+        logger.info("Pages: %s", result['pdf_info']['page_count'])
+        logger.info("OCR required: %s", result['pdf_info']['requires_ocr'])
         logger.info(
-            f"Entities found: {result['entity_extraction']['entity_count']}")
+            "Entities found: %s", result['entity_extraction']['entity_count'])
         logger.info(
-            f"Products found: {result['data_processing']['product_count']}")
+            "Products found: %s", result['data_processing']['product_count'])
 
         if not args.no_db and result['database_storage'].get('success', False):
-            logger.info(
-                f"Document ID: {result['database_storage'].get('document_id')}")
-            logger.info(
-                f"Product IDs: {result['database_storage'].get('product_ids', [])}")
+            logger.info("Document ID: %s",
+                        result['database_storage'].get('document_id'))
+            logger.info("Product IDs: %s",
+                        result['database_storage'].get('product_ids', []))
 
     elif os.path.isdir(args.input):
         # Process directory
-        logger.info(f"Processing directory: {args.input}")
+        logger.info("Processing directory: %s", args.input)
         result = process_directory(
             input_dir=args.input,
             output_dir=args.output_dir,
@@ -333,18 +878,22 @@ def main():
             file_pattern=args.pattern,
             save_intermediates=args.save_intermediates,
             store_in_db=not args.no_db,
-            max_workers=args.workers
+            max_workers=args.workers,
+            resume=args.resume,
+            cache_dir=cache_dir
         )
 
         # Print summary
         logger.info("Batch processing completed")
-        logger.info(f"Files processed: {result['file_count']}")
-        logger.info(f"Successful: {result['successful']}")
-        logger.info(f"Failed: {result['failed']}")
-        logger.info(f"Products found: {result['products_found']}")
+        logger.info("Files processed: %s", result['file_count'])
+        logger.info("Successful: %s", result['successful'])
+        logger.info("Failed: %s", result['failed'])
+        logger.info("Skipped: %s", result['skipped'])
+        logger.info("Products found: %s", result['products_found'])
+        logger.info("Results written to %s", result['results_path'])
 
     else:
-        logger.error(f"Input not found: {args.input}")
+        logger.error("Input not found: %s", args.input)
         return 1
 
     return 0
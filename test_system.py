@@ -6,6 +6,8 @@ import json
 import argparse
 import logging
 import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
@@ -13,7 +15,18 @@ logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Optional modules probed by the checks below
+CHECKED_MODULES = [
+    "sqlalchemy",
+    "psycopg2",
+    "pdfplumber",
+    "pytesseract",
+    "spacy",
+    "requests"
+]
 
+
+@lru_cache(maxsize=None)
 def is_module_available(module_name):
     """Check if a module can be imported"""
     return importlib.util.find_spec(module_name) is not None
@@ -36,7 +49,7 @@ def check_directories():
     for directory in required_dirs:
         if not os.path.exists(directory):
             os.makedirs(directory, exist_ok=True)
-            logger.info(f"Created missing directory: {directory}")
+            logger.info("Created missing directory: %s", directory)
 
     return True
 
@@ -65,7 +78,7 @@ def check_database(skip=False):
                 logger.info("Database connection successful")
                 return True
     except Exception as e:
-        logger.error(f"Database connection failed: {e}")
+        logger.error("Database connection failed: %s", e)
         logger.info("Make sure PostgreSQL is running and the database exists.")
         return False
 
@@ -98,10 +111,10 @@ def check_pdf_processing(skip=False):
         logger.info("PDF processing module imported successfully")
         return True
     except ImportError as e:
-        logger.error(f"PDF processing module import failed: {e}")
+        logger.error("PDF processing module import failed: %s", e)
         return False
     except Exception as e:
-        logger.error(f"PDF processing test failed: {e}")
+        logger.error("PDF processing test failed: %s", e)
         return False
 
 
@@ -130,10 +143,10 @@ def check_nlp_pipeline(skip=False):
         logger.info("NLP module imported successfully")
         return True
     except ImportError as e:
-        logger.error(f"NLP module import failed: {e}")
+        logger.error("NLP module import failed: %s", e)
         return False
     except Exception as e:
-        logger.error(f"NLP pipeline test failed: {e}")
+        logger.error("NLP pipeline test failed: %s", e)
         return False
 
 
@@ -157,15 +170,15 @@ def check_api(skip=False):
             logger.info("API connection successful")
             return True
         else:
-            logger.error(
-                f"API returned unexpected status code: {response.status_code}")
+            logger.error("API returned unexpected status code: %s",
+                         response.status_code)
             return False
     except requests.exceptions.ConnectionError:
         logger.error("API connection failed - server not running")
         logger.info("Start the API with: python -m src.api.main")
         return False
     except Exception as e:
-        logger.error(f"API test failed: {e}")
+        logger.error("API test failed: %s", e)
         return False
 
 
@@ -184,23 +197,34 @@ def main():
 
     results = {}
 
+    # Probe optional modules once up front; the checks reuse cached results
+    for module_name in CHECKED_MODULES:
+        is_module_available(module_name)
+
     # Always check directories
     results["DIRECTORIES"] = check_directories()
 
-    # Run tests as requested
-    results["DATABASE"] = check_database(skip=args.skip_db)
-    results["PDF_PROCESSING"] = check_pdf_processing(skip=args.skip_pdf)
-    results["NLP"] = check_nlp_pipeline(skip=args.skip_nlp)
-    results["API"] = check_api(skip=args.skip_api)
+    # Run tests as requested; they are independent and mostly wait on
+    # network and disk, so run them concurrently
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            "DATABASE": executor.submit(check_database, skip=args.skip_db),
+            "PDF_PROCESSING": executor.submit(
+                check_pdf_processing, skip=args.skip_pdf),
+            "NLP": executor.submit(check_nlp_pipeline, skip=args.skip_nlp),
+            "API": executor.submit(check_api, skip=args.skip_api)
+        }
+        for name, future in futures.items():
+            results[name] = future.result()
 
     # Print summary
     logger.info("=== TEST RESULTS ===")
     for test, result in results.items():
-        logger.info(f"{test}: {'PASS' if result else 'FAIL'}")
+        logger.info("%s: %s", test, 'PASS' if result else 'FAIL')
 
     passed = sum(1 for result in results.values() if result)
     total = len(results)
-    logger.info(f"SUMMARY: {passed}/{total} tests passed")
+    logger.info("SUMMARY: %s/%s tests passed", passed, total)
 
     if passed < total:
         logger.warning("SOME TESTS FAILED!")